@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import os
 import pathlib
+import re
 from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
@@ -16,6 +17,9 @@ from textual_universal_directorytree import UPath
 
 from browsr.utils import handle_github_url
 
+_github_prefix = re.compile(r"^(?:https?://)?(?:www\.)?")
+_github_suffix = re.compile(r"\.git$")
+
 
 @dataclass
 class TextualAppContext:
@@ -29,20 +33,38 @@ class TextualAppContext:
     max_file_size: int = 20
     max_lines: int = 1000
     kwargs: dict[str, Any] | None = None
+    _resolved_path: UPath | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Drop the cached path when the values it is resolved from change
+        """
+        if name in ("file_path", "kwargs"):
+            object.__setattr__(self, "_resolved_path", None)
+        super().__setattr__(name, value)
 
     @property
     def path(self) -> UPath:
         """
         Resolve `file_path` to a UPath object
+
+        The resolved path is cached and only recomputed when `file_path`
+        or `kwargs` are reassigned.
+        """
+        if self._resolved_path is None:
+            self._resolved_path = self._resolve_path()
+        return self._resolved_path
+
+    def _resolve_path(self) -> UPath:
+        """
+        Normalize `file_path` and resolve it to a UPath object
         """
         if "github" in str(self.file_path).lower():
-            file_path = str(self.file_path)
-            file_path = file_path.lstrip("https://")  # noqa: B005
-            file_path = file_path.lstrip("http://")  # noqa: B005
-            file_path = file_path.lstrip("www.")  # noqa: B005
-            if file_path.endswith(".git"):
-                file_path = file_path[:-4]
-            file_path = handle_github_url(url=str(file_path))
+            file_path = _github_prefix.sub("", str(self.file_path))
+            file_path = _github_suffix.sub("", file_path)
+            file_path = handle_github_url(url=file_path)
             self.file_path = file_path
         if str(self.file_path).endswith("/") and len(str(self.file_path)) > 1:
             self.file_path = str(self.file_path)[:-1]
@@ -60,6 +82,24 @@ class SortedBindingsApp(App[str]):
     """
 
     BINDING_WEIGHTS: ClassVar[dict[str, int]] = {}
+    _builtin_binding_weight: ClassVar[int] = 500
+    _max_binding_weight: ClassVar[int] = 999
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Validate the BINDING_WEIGHTS range once, when the class is created
+
+        Raises
+        ------
+        ValueError
+            If binding weights are out of range
+        """
+        super().__init_subclass__(**kwargs)
+        weights = cls.BINDING_WEIGHTS.values()
+        if max(weights, default=0) > cls._max_binding_weight:
+            raise ValueError("Binding weights must be less than 1000")
+        elif min(weights, default=1) < 1:
+            raise ValueError("Binding weights must be greater than 0")
 
     @property
     def namespace_bindings(self) -> dict[str, tuple[DOMNode, Binding]]:
@@ -80,7 +120,7 @@ class SortedBindingsApp(App[str]):
         Raises
         ------
         ValueError
-            If binding weights are invalid
+            If binding weights overlap with the default weights
 
         Returns
         -------
@@ -90,16 +130,17 @@ class SortedBindingsApp(App[str]):
         existing_bindings = super().namespace_bindings
         if not self.BINDING_WEIGHTS:
             return existing_bindings
-        builtin_index = 500
-        max_weight = 999
-        binding_range = range(builtin_index, builtin_index + len(existing_bindings))
-        weights = dict(zip(existing_bindings.keys(), binding_range))
-        if max(*self.BINDING_WEIGHTS.values(), 0) > max_weight:
-            raise ValueError("Binding weights must be less than 1000")
-        elif min(*self.BINDING_WEIGHTS.values(), 1) < 1:
-            raise ValueError("Binding weights must be greater than 0")
-        elif set(self.BINDING_WEIGHTS.values()).intersection(binding_range):
+        builtin_index = self._builtin_binding_weight
+        builtin_limit = builtin_index + len(existing_bindings)
+        if any(
+            builtin_index <= weight < builtin_limit
+            for weight in self.BINDING_WEIGHTS.values()
+        ):
             raise ValueError("Binding weights must not overlap with existing bindings")
+        weights = {
+            key: builtin_index + position
+            for position, key in enumerate(existing_bindings)
+        }
         weights.update(self.BINDING_WEIGHTS)
         updated_bindings = dict(
             sorted(
@@ -9,10 +9,6 @@ import click
 import rich_click
 
 from browsr.__about__ import __application__, __version__
-from browsr.base import (
-    TextualAppContext,
-)
-from browsr.browsr import Browsr
 
 rich_click.rich_click.MAX_WIDTH = 100
 rich_click.rich_click.STYLE_OPTION = "bold green"
@@ -214,6 +210,9 @@ def browsr(
                     ),
                     param_hint="kwargs",
                 ) from ve
+    from browsr.base import TextualAppContext
+    from browsr.browsr import Browsr
+
     file_path = path or os.getcwd()
     config = TextualAppContext(
         file_path=file_path,
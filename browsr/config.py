@@ -3,7 +3,7 @@ browsr configuration file
 """
 
 from os import getenv
-from typing import List
+from typing import Dict, FrozenSet, List
 
 favorite_themes: List[str] = [
     "monokai",
@@ -25,36 +25,58 @@ if rich_default_theme in favorite_themes:
 if rich_default_theme is not None:
     favorite_themes.insert(0, rich_default_theme)
 
-image_file_extensions = [
-    ".bmp",
-    ".dib",
-    ".eps",
-    ".ps",
-    ".gif",
-    ".icns",
-    ".ico",
-    ".cur",
-    ".im",
-    ".im.gz",
-    ".im.bz2",
-    ".jpg",
-    ".jpe",
-    ".jpeg",
-    ".jfif",
-    ".msp",
-    ".pcx",
-    ".png",
-    ".ppm",
-    ".pbm",
-    ".pgm",
-    ".sgi",
-    ".rgb",
-    ".bw",
-    ".spi",
-    ".tif",
-    ".tiff",
-    ".webp",
-    ".xbm",
-    ".xv",
-    ".pdf",
-]
+image_file_extensions: FrozenSet[str] = frozenset(
+    {
+        ".bmp",
+        ".dib",
+        ".eps",
+        ".ps",
+        ".gif",
+        ".icns",
+        ".ico",
+        ".cur",
+        ".im",
+        ".im.gz",
+        ".im.bz2",
+        ".jpg",
+        ".jpe",
+        ".jpeg",
+        ".jfif",
+        ".msp",
+        ".pcx",
+        ".png",
+        ".ppm",
+        ".pbm",
+        ".pgm",
+        ".sgi",
+        ".rgb",
+        ".bw",
+        ".spi",
+        ".tif",
+        ".tiff",
+        ".webp",
+        ".xbm",
+        ".xv",
+        ".pdf",
+    }
+)
+
+file_extension_lexers: Dict[str, str] = {
+    ".c": "c",
+    ".cpp": "cpp",
+    ".css": "css",
+    ".go": "go",
+    ".h": "c",
+    ".html": "html",
+    ".java": "java",
+    ".js": "javascript",
+    ".json": "json",
+    ".py": "python",
+    ".rs": "rust",
+    ".sh": "bash",
+    ".sql": "sql",
+    ".toml": "toml",
+    ".ts": "typescript",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
@@ -6,7 +6,6 @@ from __future__ import annotations
 
 from typing import ClassVar, Iterable, cast
 
-from rich import traceback
 from textual import on
 from textual.binding import Binding, BindingType
 from textual.containers import Horizontal
@@ -17,7 +16,7 @@ from textual.widgets import Footer, Header
 from textual_universal_directorytree import UPath
 
 from browsr.base import TextualAppContext
-from browsr.utils import get_file_info
+from browsr.utils import FileInfo, get_file_info
 from browsr.widgets.code_browser import CodeBrowser
 from browsr.widgets.files import CurrentFileInfoBar
 
@@ -50,7 +49,10 @@ class CodeBrowserScreen(Screen):
         """
         super().__init__()
         self.config_object = config_object or TextualAppContext()
-        traceback.install(show_locals=True)
+        if self.config_object.debug:
+            from rich import traceback
+
+            traceback.install(show_locals=True)
         self.header = Header()
         self.code_browser = CodeBrowser(config_object=self.config_object)
         self.file_information = CurrentFileInfoBar()
@@ -80,23 +82,25 @@ class CodeBrowserScreen(Screen):
         """
         On Application Mount - See If a File Should be Displayed
         """
-        if self.code_browser.selected_file_path is not None:
-            self.code_browser.show_tree = self.code_browser.force_show_tree
-            self.code_browser.window_switcher.render_file(
-                file_path=self.code_browser.selected_file_path
-            )
-            if (
-                self.code_browser.show_tree is False
-                and self.code_browser.static_window.display is True
-            ):
-                self.code_browser.window_switcher.focus()
-            elif (
-                self.code_browser.show_tree is False
-                and self.code_browser.datatable_window.display is True
-            ):
-                self.code_browser.datatable_window.focus()
-        else:
-            self.code_browser.show_tree = True
+        with self.app.batch_update():
+            if self.code_browser.selected_file_path is not None:
+                self.code_browser.show_tree = self.code_browser.force_show_tree
+                self.code_browser.window_switcher.render_file(
+                    file_path=self.code_browser.selected_file_path,
+                    file_info=cast(FileInfo, self.file_information.file_info),
+                )
+                if (
+                    self.code_browser.show_tree is False
+                    and self.code_browser.static_window.display is True
+                ):
+                    self.code_browser.window_switcher.focus()
+                elif (
+                    self.code_browser.show_tree is False
+                    and self.code_browser.datatable_window.display is True
+                ):
+                    self.code_browser.datatable_window.focus()
+            else:
+                self.code_browser.show_tree = True
 
     @on(CurrentFileInfoBar.FileInfoUpdate)
     def update_file_info(self, message: CurrentFileInfoBar.FileInfoUpdate) -> None:
@@ -164,8 +168,11 @@ class CodeBrowserScreen(Screen):
         if reload_file:
             selected_file_path = cast(UPath, self.code_browser.selected_file_path)
             file_name = selected_file_path.name
+            file_info = get_file_info(file_path=selected_file_path)
+            self.file_information.file_info = file_info
             self.code_browser.window_switcher.render_file(
                 file_path=selected_file_path,
+                file_info=file_info,
                 scroll_home=False,
             )
             message_lines.append("[bold]File:[/bold] " f"[italic]{file_name}[/italic]")
@@ -3,24 +3,43 @@ Code Browsr Utility Functions
 """
 
 import datetime
+import functools
+import math
 import os
+import re
 from dataclasses import dataclass
-from typing import Any, BinaryIO, Dict, Optional, Union
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Union
 
-import fitz
-import rich_pixels
-from fitz import Pixmap
-from PIL import Image
-from rich_pixels import Pixels
 from textual_universal_directorytree import UPath, is_remote_path
 
+if TYPE_CHECKING:
+    import requests
+    from fitz import Pixmap
+    from PIL import Image
+    from rich_pixels import Pixels
 
-def _open_pdf_as_image(buf: BinaryIO) -> Image.Image:
+
+def _open_pdf_as_image(document: UPath, screen_width: float) -> "Image.Image":
     """
     Open a PDF file and return a PIL.Image object
+
+    Local files are opened by name so fitz can read them directly, only
+    remote files are read into memory. The first page is rasterized at
+    (or below) the screen width so the full resolution page never has to
+    be rendered and then shrunk.
     """
-    doc = fitz.open(stream=buf.read(), filetype="pdf")
-    pix: Pixmap = doc[0].get_pixmap()
+    import fitz
+    from PIL import Image
+
+    if is_remote_path(document):
+        with document.open("rb") as buf:
+            doc = fitz.open(stream=buf.read(), filetype="pdf")
+    else:
+        doc = fitz.open(str(document), filetype="pdf")
+    page = doc[0]
+    zoom = min(screen_width / page.rect.width, 1)
+    pix: "Pixmap" = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
     if pix.colorspace is None:
         mode = "L"
     elif pix.colorspace.n == 1:
@@ -29,25 +48,52 @@ def _open_pdf_as_image(buf: BinaryIO) -> Image.Image:
         mode = "RGB" if pix.alpha == 0 else "RGBA"
     else:
         mode = "CMYK"
-    return Image.frombytes(size=(pix.width, pix.height), data=pix.samples, mode=mode)
+    return Image.frombuffer(
+        mode, (pix.width, pix.height), pix.samples, "raw", mode, 0, 1
+    )
 
 
-def open_image(document: UPath, screen_width: float) -> Pixels:
+_ImageCacheKey = Tuple[UPath, float, Optional[datetime.datetime], int]
+
+
+def open_image(document: UPath, screen_width: float, file_info: "FileInfo") -> "Pixels":
     """
     Open an image file and return a rich_pixels.Pixels object
+
+    Images are cached per file version (modified time and size) and
+    screen width, re-rendering an unchanged image doesn't decode it again.
     """
+    cache_key: _ImageCacheKey = (
+        document,
+        screen_width,
+        file_info.last_modified,
+        file_info.size,
+    )
+    return _open_image(cache_key=cache_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _open_image(cache_key: _ImageCacheKey) -> "Pixels":
+    """
+    Decode an image into a rich_pixels.Pixels object
+
+    `cache_key` is `(document, screen_width, last_modified, size)`, only
+    the first two are needed to decode the image.
+    """
+    from rich_pixels import Pixels
+
+    document, screen_width, _, _ = cache_key
+    if document.suffix.lower() == ".pdf":
+        image = _open_pdf_as_image(document=document, screen_width=screen_width)
+        return Pixels.from_image(image)
+    from PIL import Image
+
     with document.open("rb") as buf:
-        if document.suffix.lower() == ".pdf":
-            image = _open_pdf_as_image(buf=buf)
-        else:
-            image = Image.open(buf)
-        image_width = image.width
-        image_height = image.height
-        size_ratio = image_width / screen_width
-        new_width = min(int(image_width / size_ratio), image_width)
-        new_height = min(int(image_height / size_ratio), image_height)
-        resized = image.resize((new_width, new_height))
-        return rich_pixels.Pixels.from_image(resized)
+        image = Image.open(buf)
+        width = int(screen_width)
+        height = math.ceil(image.height * width / image.width)
+        image.thumbnail((width, height), resample=Image.Resampling.BILINEAR)
+        return Pixels.from_image(image)
 
 
 @dataclass
@@ -67,13 +113,62 @@ class FileInfo:
     is_cloudpath: bool
 
 
+@functools.lru_cache(maxsize=128)
+def _owner_name(uid: int) -> str:
+    """
+    Look up the user name for a uid, once per uid
+    """
+    try:
+        import pwd
+    except ImportError:
+        return ""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@functools.lru_cache(maxsize=128)
+def _group_name(gid: int) -> str:
+    """
+    Look up the group name for a gid, once per gid
+    """
+    try:
+        import grp
+    except ImportError:
+        return ""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+def _parse_timestamp(timestamp: str) -> datetime.datetime:
+    """
+    Parse an ISO timestamp from a remote filesystem, dropping a trailing "Z"
+    """
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1]
+    return datetime.datetime.fromisoformat(timestamp)
+
+
 def get_file_info(file_path: UPath) -> FileInfo:
     """
     Get File Information, Regardless of the FileSystem
+
+    Local files are described from a single `stat` call, owner and
+    group names are resolved from the cached uid / gid lookups. Other
+    filesystems are described from their fsspec info dict.
     """
+    stat: Union[Dict[str, Any], os.stat_result]
     try:
-        stat: Union[Dict[str, Any], os.stat_result] = file_path.stat()
-        is_file = file_path.is_file()
+        path_stat = file_path.stat()
+        if isinstance(path_stat, os.stat_result):
+            stat = path_stat
+            is_file = S_ISREG(stat.st_mode)
+        else:
+            stat = dict(path_stat.as_info())
+            is_file = file_path.is_file()
     except PermissionError:
         stat = {"size": 0}
         is_file = True
@@ -83,7 +178,7 @@ def get_file_info(file_path: UPath) -> FileInfo:
     is_cloudpath = is_remote_path(file_path)
     if isinstance(stat, dict):
         lower_dict = {key.lower(): value for key, value in stat.items()}
-        file_size = lower_dict["size"]
+        file_size = lower_dict.get("size") or 0
         modified_keys = ["lastmodified", "updated", "mtime"]
         last_modified = None
         for modified_key in modified_keys:
@@ -91,13 +186,17 @@ def get_file_info(file_path: UPath) -> FileInfo:
                 last_modified = lower_dict[modified_key]
                 break
         if isinstance(last_modified, str):
-            last_modified = datetime.datetime.fromisoformat(last_modified[:-1])
+            last_modified = _parse_timestamp(last_modified)
+        elif isinstance(last_modified, (int, float)):
+            last_modified = datetime.datetime.fromtimestamp(
+                last_modified, tz=datetime.timezone.utc
+            )
         return FileInfo(
             file=file_path,
             size=file_size,
             last_modified=last_modified,
             stat=stat,
-            is_local=False,
+            is_local=not is_cloudpath,
             is_file=is_file,
             owner="",
             group="",
@@ -107,12 +206,6 @@ def get_file_info(file_path: UPath) -> FileInfo:
         last_modified = datetime.datetime.fromtimestamp(
             stat.st_mtime, tz=datetime.timezone.utc
         )
-        try:
-            owner = file_path.owner()
-            group = file_path.group()
-        except NotImplementedError:
-            owner = ""
-            group = ""
         return FileInfo(
             file=file_path,
             size=stat.st_size,
@@ -120,8 +213,8 @@ def get_file_info(file_path: UPath) -> FileInfo:
             stat=stat,
             is_local=True,
             is_file=is_file,
-            owner=owner,
-            group=group,
+            owner=_owner_name(stat.st_uid),
+            group=_group_name(stat.st_gid),
             is_cloudpath=is_cloudpath,
         )
 
@@ -135,14 +228,64 @@ def handle_duplicate_filenames(file_path: UPath) -> UPath:
     """
     if not file_path.exists():
         return file_path
-    else:
-        i = 1
-        while True:
-            new_file_stem = f"{file_path.stem} ({i})"
-            new_file_path = file_path.with_stem(new_file_stem)
-            if not new_file_path.exists():
-                return new_file_path
-            i += 1
+    duplicate_pattern = re.compile(
+        rf"{re.escape(file_path.stem)} \(([1-9]\d*)\){re.escape(file_path.suffix)}"
+    )
+    existing_numbers: Set[int] = set()
+    for sibling in file_path.parent.iterdir():
+        duplicate_match = duplicate_pattern.fullmatch(sibling.name)
+        if duplicate_match is not None:
+            existing_numbers.add(int(duplicate_match.group(1)))
+    i = 1
+    while i in existing_numbers:
+        i += 1
+    return file_path.with_name(f"{file_path.stem} ({i}){file_path.suffix}")
+
+
+_github_url_pattern = re.compile(
+    r"^(?:https?://)?(?:www\.)?(?i:github)(?:://|\.com/)"
+    r"(?P<org>[^/:@]+)[:/](?P<repo>[^/@]+)"
+    r"(?:@(?P<branch>[^/]+))?(?P<args>/.*)?$"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _github_session() -> "requests.Session":
+    """
+    Get the shared GitHub API session
+
+    The session is created on first use and keeps its connections open,
+    retrying transient server errors.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({"Accept": "application/vnd.github.v3+json"})
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_default_branch(org: str, repo: str, token: Optional[str]) -> str:
+    """
+    Look up the default branch of a GitHub repository
+
+    Results are cached for the life of the process, so a repository is
+    only looked up once.
+    """
+    auth = {"auth": ("Bearer", token)} if token is not None else {}
+    resp = _github_session().get(
+        f"https://api.github.com/repos/{org}/{repo}",
+        timeout=10,
+        **auth,  # type: ignore[arg-type]
+    )
+    resp.raise_for_status()
+    default_branch: str = resp.json()["default_branch"]
+    return default_branch
 
 
 def handle_github_url(url: str) -> str:
@@ -152,37 +295,25 @@ def handle_github_url(url: str) -> str:
     GitHub URLs are handled by converting them to the raw URL.
     """
     try:
-        import requests
+        import requests  # noqa: F401
     except ImportError as e:
         raise ImportError(
             "The requests library is required to browse GitHub files. "
             "Install browsr with the `remote` extra to install requests."
         ) from e
 
-    gitub_prefix = "github://"
-    if gitub_prefix in url and "@" not in url:
-        _, user_password = url.split("github://")
-        org, repo_str = user_password.split(":")
-        repo, *args = repo_str.split("/")
-    elif gitub_prefix in url and "@" in url:
-        return url
-    elif "github.com" in url.lower():
-        _, org, repo, *args = url.split("/")
-    else:
+    github_match = _github_url_pattern.match(url)
+    if github_match is None:
         msg = f"Invalid GitHub URL: {url}"
         raise ValueError(msg)
-    token = os.getenv("GITHUB_TOKEN")
-    auth = {"auth": ("Bearer", token)} if token is not None else {}
-    resp = requests.get(
-        f"https://api.github.com/repos/{org}/{repo}",
-        headers={"Accept": "application/vnd.github.v3+json"},
-        timeout=10,
-        **auth,  # type: ignore[arg-type]
+    elif github_match.group("branch") is not None:
+        return url
+    org, repo = github_match.group("org", "repo")
+    default_branch = _lookup_default_branch(
+        org=org, repo=repo, token=os.getenv("GITHUB_TOKEN")
     )
-    resp.raise_for_status()
-    default_branch = resp.json()["default_branch"]
-    arg_str = "/".join(args)
-    github_uri = f"{gitub_prefix}{org}:{repo}@{default_branch}/{arg_str}".rstrip("/")
+    arg_str = (github_match.group("args") or "").lstrip("/")
+    github_uri = f"github://{org}:{repo}@{default_branch}/{arg_str}".rstrip("/")
     return github_uri
 
 
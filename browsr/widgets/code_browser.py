@@ -8,16 +8,18 @@ import inspect
 import pathlib
 import shutil
 from textwrap import dedent
-from typing import Any
+from typing import Any, ClassVar
 
 import pyperclip
 from rich.markdown import Markdown
+from rich.syntax import Syntax
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.events import Mount
 from textual.reactive import var
 from textual.widgets import DirectoryTree
+from textual.worker import get_current_worker
 from textual_universal_directorytree import (
     UPath,
     is_remote_path,
@@ -26,7 +28,6 @@ from textual_universal_directorytree import (
 from browsr.base import (
     TextualAppContext,
 )
-from browsr.config import favorite_themes
 from browsr.exceptions import FileSizeError
 from browsr.utils import (
     get_file_info,
@@ -53,8 +54,8 @@ class CodeBrowser(Container):
         - Exceptions
     """
 
-    theme_index = var(0)
-    rich_themes = favorite_themes
+    download_chunk_size: ClassVar[int] = 4 * 1024 * 1024
+
     show_tree = var(True)
     force_show_tree = var(False)
     selected_file_path: UPath | None | var[None] = var(None)
@@ -177,20 +178,45 @@ class CodeBrowser(Container):
         Called when the user click a file in the directory tree.
         """
         self.selected_file_path = message.path
-        file_info = get_file_info(file_path=self.selected_file_path)
+        self.load_selected_file(file_path=message.path)
+
+    @work(thread=True, exclusive=True, group="file_loader")
+    def load_selected_file(self, file_path: UPath) -> None:
+        """
+        Load the selected file off the event loop and display it.
+
+        Selecting another file cancels this worker, stale results are dropped.
+        """
+        worker = get_current_worker()
+        file_info = get_file_info(file_path=file_path)
         try:
             self.static_window.handle_file_size(
                 file_info=file_info, max_file_size=self.config_object.max_file_size
             )
-            self.window_switcher.render_file(file_path=self.selected_file_path)
+            content = self.window_switcher.load_file(
+                file_path=file_path, file_info=file_info
+            )
         except FileSizeError as e:
             error_message = self.static_window.handle_exception(exception=e)
             error_syntax = self.static_window.text_to_syntax(
-                text=error_message, file_path=self.selected_file_path
+                text=error_message, file_path=file_path
             )
-            self.static_window.update(error_syntax)
-            self.window_switcher.switch_window(self.static_window)
-        self.post_message(CurrentFileInfoBar.FileInfoUpdate(new_file=file_info))
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._show_file_error, error_syntax)
+        else:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(
+                    self.window_switcher.show_file, file_path=file_path, content=content
+                )
+        if not worker.is_cancelled:
+            self.post_message(CurrentFileInfoBar.FileInfoUpdate(new_file=file_info))
+
+    def _show_file_error(self, error_syntax: Syntax) -> None:
+        """
+        Display a file error in the static window
+        """
+        self.static_window.update(error_syntax)
+        self.window_switcher.switch_window(self.static_window)
 
     @on(DoubleClickDirectoryTree.DirectoryDoubleClicked)
     def handle_directory_double_click(
@@ -265,7 +291,9 @@ class CodeBrowser(Container):
             handled_download_path = self._get_download_file_name()
             with self.selected_file_path.open("rb") as file_handle:
                 with handled_download_path.open("wb") as download_handle:
-                    shutil.copyfileobj(file_handle, download_handle)
+                    shutil.copyfileobj(
+                        file_handle, download_handle, length=self.download_chunk_size
+                    )
             self.notify(
                 message=str(handled_download_path),
                 title="Download Complete",
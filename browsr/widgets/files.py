@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import math
+from typing import Any, ClassVar
 
 from rich.console import RenderableType
+from rich.style import Style
 from rich.text import Text
 from textual.message import Message
 from textual.reactive import reactive
@@ -26,6 +27,8 @@ class CurrentFileInfoBar(Widget):
 
     file_info: FileInfo | None = reactive(None)
 
+    text_style: ClassVar[Style] = Style(dim=True)
+
     class FileInfoUpdate(Message):
         """
         File Info Bar Update
@@ -35,10 +38,15 @@ class CurrentFileInfoBar(Widget):
             self.new_file = new_file
             super().__init__()
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._rendered_text: Text | None = None
+
     def watch_file_info(self, new_file: FileInfo | None) -> None:
         """
         Watch the file_info property for changes
         """
+        self._rendered_text = None
         if new_file is None:
             self.display = False
         else:
@@ -49,11 +57,12 @@ class CurrentFileInfoBar(Widget):
         """
         Convert Bytes to Human Readable String
         """
-        if size_bytes == 0:
+        size_bytes = int(size_bytes)
+        if size_bytes <= 0:
             return " 0B"
         size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-        index = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, index)
+        index = min((size_bytes.bit_length() - 1) // 10, len(size_name) - 1)
+        p = 1 << (index * 10)
         number = round(size_bytes / p, 2)
         unit = size_name[index]
         return f"{number:.0f}{unit}"
@@ -62,77 +71,80 @@ class CurrentFileInfoBar(Widget):
         """
         Render the Current File Info Bar
         """
-        status_string = self.render_file_protocol()
-        if self.file_info is None:
-            return Text(status_string)
-        elif self.file_info.is_file:
-            file_options = self.render_file_options()
-            status_string += file_options
+        file_info = self.file_info
+        if file_info is None:
+            return Text(self.render_file_protocol())
+        if self._rendered_text is not None:
+            return self._rendered_text
+        status_parts = [self.render_file_protocol()]
+        if file_info.is_file:
+            status_parts.append(self.render_file_options())
         if (
-            self.file_info.last_modified is not None
-            and self.file_info.last_modified.timestamp() != 0
+            file_info.last_modified is not None
+            and file_info.last_modified.timestamp() != 0
         ):
-            modify_time = self.file_info.last_modified.strftime("%b %d, %Y %I:%M %p")
-            status_string += f"  📅  {modify_time}"
-        directory_options = self.render_directory_options()
-        status_string += directory_options
-        return Text(status_string.strip(), style="dim")
+            modify_time = file_info.last_modified.strftime("%b %d, %Y %I:%M %p")
+            status_parts.append(f"  📅  {modify_time}")
+        status_parts.append(self.render_directory_options())
+        status_string = "".join(status_parts)
+        self._rendered_text = Text(status_string.strip(), style=self.text_style)
+        return self._rendered_text
 
     def render_file_options(self) -> str:
         """
         Render the file options
         """
-        status_string = ""
-        if not self.file_info:
-            return status_string
-        if self.file_info.is_file:
-            file_size = self._convert_size(self.file_info.size)
-            status_string += f"  🗄️️  {file_size}"
-        if self.file_info.owner not in ["", None]:
-            status_string += f"  👤  {self.file_info.owner}"
-        if self.file_info.group.strip() not in ["", None]:
-            status_string += f"  🏠  {self.file_info.group}"
-        return status_string
+        file_info = self.file_info
+        if not file_info:
+            return ""
+        status_parts: list[str] = []
+        if file_info.is_file:
+            file_size = self._convert_size(file_info.size)
+            status_parts.append(f"  🗄️️  {file_size}")
+        if file_info.owner not in ["", None]:
+            status_parts.append(f"  👤  {file_info.owner}")
+        if file_info.group.strip() not in ["", None]:
+            status_parts.append(f"  🏠  {file_info.group}")
+        return "".join(status_parts)
 
     def render_directory_options(self) -> str:
         """
         Render the directory options
         """
-        status_string = ""
-        if not self.file_info:
-            return status_string
-        if self.file_info.is_file:
-            directory_name = self.file_info.file.parent.name
+        file_info = self.file_info
+        if not file_info:
+            return ""
+        status_parts: list[str] = []
+        if file_info.is_file:
+            directory_name = file_info.file.parent.name
             if not directory_name or (
-                self.file_info.file.protocol
-                and f"{self.file_info.file.protocol}://" in directory_name
+                file_info.file.protocol
+                and f"{file_info.file.protocol}://" in directory_name
             ):
-                directory_name = str(self.file_info.file.parent)
-                directory_name = directory_name.lstrip(
-                    f"{self.file_info.file.protocol}://"
-                )
+                directory_name = str(file_info.file.parent)
+                protocol_prefix = f"{file_info.file.protocol}://"
+                if directory_name.startswith(protocol_prefix):
+                    directory_name = directory_name[len(protocol_prefix) :]
                 directory_name = directory_name.rstrip("/")
-            status_string += f"  📂  {directory_name}"
-            status_string += f"  💾  {self.file_info.file.name}"
+            status_parts.append(f"  📂  {directory_name}")
+            status_parts.append(f"  💾  {file_info.file.name}")
         else:
-            status_string += f"  📂  {self.file_info.file.name}"
-        return status_string
+            status_parts.append(f"  📂  {file_info.file.name}")
+        return "".join(status_parts)
 
     def render_file_protocol(self) -> str:
         """
         Render the file protocol
         """
-        status_string = ""
-        if not self.file_info:
-            return status_string
-        if is_remote_path(self.file_info.file):
-            if isinstance(self.file_info.file, GitHubTextualPath):
-                protocol = "GitHub"
-            elif isinstance(self.file_info.file, S3TextualPath):
-                protocol = "S3"
-            elif isinstance(self.file_info.file, SFTPTextualPath):
-                protocol = "SFTP"
-            else:
-                protocol = self.file_info.file.protocol
-            status_string += f"🗂️  {protocol}"
-        return status_string
+        file_info = self.file_info
+        if not file_info or not is_remote_path(file_info.file):
+            return ""
+        if isinstance(file_info.file, GitHubTextualPath):
+            protocol = "GitHub"
+        elif isinstance(file_info.file, S3TextualPath):
+            protocol = "S3"
+        elif isinstance(file_info.file, SFTPTextualPath):
+            protocol = "SFTP"
+        else:
+            protocol = file_info.file.protocol
+        return f"🗂️  {protocol}"
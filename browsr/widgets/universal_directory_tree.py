@@ -4,12 +4,17 @@ A universal directory tree widget for Textual.
 
 from __future__ import annotations
 
-from typing import ClassVar, Iterable
+import os
+from pathlib import Path
+from typing import Any, ClassVar, Iterable, Iterator
 
+from textual import work
 from textual.binding import BindingType
 from textual.widgets._directory_tree import DirEntry
 from textual.widgets._tree import TreeNode
+from textual.worker import Worker, get_current_worker
 from textual_universal_directorytree import UniversalDirectoryTree, UPath
+from upath.implementations.local import PosixUPath, WindowsUPath
 
 from browsr.widgets.double_click_directory_tree import DoubleClickDirectoryTree
 from browsr.widgets.vim import vim_cursor_bindings
@@ -25,42 +30,120 @@ class BrowsrDirectoryTree(DoubleClickDirectoryTree, UniversalDirectoryTree):
         *vim_cursor_bindings,
     ]
 
+    def validate_path(self, path: str | Path) -> Path:
+        """
+        Ensure that the path is of the `UPath` type, reusing existing UPaths
+
+        This function overrides the original method so setting `path` to a
+        UPath doesn't build (and resolve the filesystem of) an identical copy.
+        """
+        if isinstance(path, UPath):
+            return path
+        return super().validate_path(path)
+
+    @staticmethod
+    def _is_top_level_bucket(dir_path: Path) -> bool:
+        """
+        Whether the path is the root of s3, listing every bucket
+        """
+        return str(dir_path) == "s3:/"
+
     @classmethod
-    def _handle_top_level_bucket(cls, dir_path: UPath) -> Iterable[UPath] | None:
+    def _handle_top_level_bucket(cls, dir_path: Path) -> Iterable[UPath] | None:
         """
         Handle scenarios when someone wants to browse all of s3
 
         This is because S3FS handles the root directory differently
         than other filesystems
         """
-        if str(dir_path) == "s3:/":
-            sub_buckets = sorted(
-                UPath(f"s3://{bucket.name}") for bucket in dir_path.iterdir()
-            )
+        if isinstance(dir_path, UPath) and cls._is_top_level_bucket(dir_path):
+            bucket_names = sorted(dir_path.fs.ls("", detail=False))
+            sub_buckets = [
+                UPath(f"s3://{bucket_name.rstrip('/')}", **dir_path.storage_options)
+                for bucket_name in bucket_names
+            ]
             return sub_buckets
         return None
 
+    def _directory_entries(
+        self, location: Path, worker: Worker[Any]
+    ) -> Iterator[tuple[Path, bool]]:
+        """
+        Yield each path in a directory along with whether it's a directory
+
+        Plain local directories are read with `os.scandir` so the directory
+        check comes from the directory entry itself instead of another `stat`.
+        Every other filesystem goes through the regular directory listing.
+        """
+        if not isinstance(location, (PosixUPath, WindowsUPath)):
+            for path in self._directory_content(location, worker):
+                yield path, self._safe_is_dir(path)
+            return
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    try:
+                        is_dir = entry.is_dir()
+                    except PermissionError:
+                        is_dir = False
+                    yield location / entry.name, is_dir
+        except PermissionError:
+            pass
+
+    @work(thread=True, exit_on_error=False)
+    def _load_directory(self, node: TreeNode[DirEntry]) -> list[tuple[Path, bool]]:
+        """
+        Load the directory contents for a given node.
+
+        This function overrides the original textual method to check whether
+        each path is a directory only once: each path is returned along with
+        that check, for sorting and populating the node. Root level cloud
+        buckets are listed here too, off the event loop.
+        """
+        if node.data is None:
+            return []
+        top_level_buckets = self._handle_top_level_bucket(dir_path=node.data.path)
+        if top_level_buckets is not None:
+            return [(bucket, True) for bucket in top_level_buckets]
+        is_dir = dict(self._directory_entries(node.data.path, get_current_worker()))
+        entries = [
+            (path, is_dir[path] if path in is_dir else self._safe_is_dir(path))
+            for path in self.filter_paths(is_dir)
+        ]
+        entries.sort(key=lambda entry: (not entry[1], entry[0].name.lower()))
+        return entries
+
     def _populate_node(
-        self, node: TreeNode[DirEntry], content: Iterable[UPath]
+        self,
+        node: TreeNode[DirEntry],
+        content: Iterable[Path | tuple[Path, bool]],
     ) -> None:
         """
         Populate the given tree node with the given directory content.
 
         This function overrides the original textual method to handle root level
-        cloud buckets.
+        cloud buckets, which `_load_directory` has already listed, and to
+        reuse the directory checks `_load_directory` returns with each path.
         """
-        top_level_buckets = self._handle_top_level_bucket(dir_path=node.data.path)
-        if top_level_buckets is not None:
-            content = top_level_buckets
-        node.remove_children()
-        for path in content:
-            if top_level_buckets is not None:
-                path_name = str(path).replace("s3://", "").rstrip("/")
-            else:
-                path_name = path.name
-            node.add(
-                path_name,
-                data=DirEntry(path),
-                allow_expand=self._safe_is_dir(path),
-            )
-        node.expand()
+        top_level_bucket = node.data is not None and self._is_top_level_bucket(
+            dir_path=node.data.path
+        )
+        with self.app.batch_update():
+            node.remove_children()
+            for entry in content:
+                if isinstance(entry, tuple):
+                    path, allow_expand = entry
+                else:
+                    path, allow_expand = entry, self._safe_is_dir(entry)
+                if top_level_bucket:
+                    path_name = str(path)[len("s3://") :].rstrip("/")
+                else:
+                    path_name = path.name
+                node.add(
+                    path_name,
+                    data=DirEntry(path),
+                    allow_expand=allow_expand,
+                )
+            node.expand()
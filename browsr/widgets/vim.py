@@ -6,18 +6,18 @@ from textual.binding import Binding, BindingType
 from textual.containers import VerticalScroll
 from textual.widgets import DataTable
 
-vim_scroll_bindings = [
+vim_scroll_bindings: tuple[Binding, ...] = (
     Binding(key="k", action="scroll_up", description="Scroll Up", show=False),
     Binding(key="j", action="scroll_down", description="Scroll Down", show=False),
     Binding(key="h", action="scroll_left", description="Scroll Left", show=False),
     Binding(key="l", action="scroll_right", description="Scroll Right", show=False),
-]
-vim_cursor_bindings = [
+)
+vim_cursor_bindings: tuple[Binding, ...] = (
     Binding(key="k", action="cursor_up", description="Cursor Up", show=False),
     Binding(key="j", action="cursor_down", description="Cursor Down", show=False),
     Binding(key="h", action="cursor_left", description="Cursor Left", show=False),
     Binding(key="l", action="cursor_right", description="Cursor Right", show=False),
-]
+)
 
 
 class VimScroll(VerticalScroll):
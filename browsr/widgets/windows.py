@@ -4,16 +4,17 @@ Content Windows
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
+import os
 from json import JSONDecodeError
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, cast
 
-import numpy as np
-import pandas as pd
-from art import text2art
+from rich.console import RenderableType
 from rich.markdown import Markdown
+from rich.protocol import is_renderable
 from rich.syntax import Syntax
-from rich_pixels import Pixels
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.message import Message
@@ -23,7 +24,11 @@ from textual.widgets import Static
 from textual_universal_directorytree import UPath
 
 from browsr.base import TextualAppContext
-from browsr.config import favorite_themes, image_file_extensions
+from browsr.config import (
+    favorite_themes,
+    file_extension_lexers,
+    image_file_extensions,
+)
 from browsr.exceptions import FileSizeError
 from browsr.utils import (
     ArchiveFileError,
@@ -32,13 +37,19 @@ from browsr.utils import (
 )
 from browsr.widgets.vim import VimDataTable, VimScroll
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from rich_pixels import Pixels
+
 
 class BaseCodeWindow(Widget):
     """
     Base code view widget
     """
 
-    archive_extensions: ClassVar[list[str]] = [".tar", ".gz", ".zip", ".tgz"]
+    archive_extensions: ClassVar[frozenset[str]] = frozenset(
+        {".tar", ".gz", ".zip", ".tgz"}
+    )
 
     class WindowSwitch(Message):
         """
@@ -58,19 +69,25 @@ class BaseCodeWindow(Widget):
             if file_path.suffix in self.archive_extensions:
                 message = f"Cannot render archive file {file_path}."
                 raise ArchiveFileError(message)
-            text = file_path.read_text(encoding="utf-8")
+            with file_path.open("r", encoding="utf-8") as file_handle:
+                if max_lines:
+                    text = "".join(itertools.islice(file_handle, max_lines))
+                else:
+                    text = file_handle.read()
         except Exception as e:
             text = self.handle_exception(exception=e)
         if max_lines:
-            text = "\n".join(text.split("\n")[:max_lines])
+            text = self._first_lines(text, max_lines)
         return text
 
-    def file_to_image(self, file_path: UPath) -> Pixels:
+    def file_to_image(self, file_path: UPath, file_info: FileInfo) -> Pixels:
         """
         Load a file into an image
         """
         screen_width = self.app.size.width / 4
-        content = open_image(document=file_path, screen_width=screen_width)
+        content = open_image(
+            document=file_path, screen_width=screen_width, file_info=file_info
+        )
         return content
 
     def file_to_json(self, file_path: UPath, max_lines: int | None = None) -> str:
@@ -79,14 +96,49 @@ class BaseCodeWindow(Widget):
         """
         code_str = self.file_to_string(file_path=file_path)
         try:
-            code_obj = json.loads(code_str)
-            code_str = json.dumps(code_obj, indent=2)
+            code_str = self._format_json(code_str)
         except JSONDecodeError:
             pass
         if max_lines:
-            code_str = "\n".join(code_str.split("\n")[:max_lines])
+            code_str = self._first_lines(code_str, max_lines)
         return code_str
 
+    @staticmethod
+    def _first_lines(text: str, max_lines: int) -> str:
+        """
+        Return the first `max_lines` lines of text without splitting all of it
+        """
+        end = -1
+        for _ in range(max_lines):
+            end = text.find("\n", end + 1)
+            if end == -1:
+                return text
+        return text[:end]
+
+    @staticmethod
+    def _format_json(code_str: str) -> str:
+        """
+        Pretty print JSON, using orjson when it's installed
+
+        orjson rejects some documents the standard library accepts, like
+        NaN / Infinity or integers wider than 64 bits; those fall back
+        to the json module.
+        """
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            try:
+                code_obj = orjson.loads(code_str)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                return orjson.dumps(code_obj, option=orjson.OPT_INDENT_2).decode(
+                    "utf-8"
+                )
+        return json.dumps(json.loads(code_str), indent=2)
+
     @classmethod
     def handle_file_size(cls, file_info: FileInfo, max_file_size: int = 5) -> None:
         """
@@ -97,6 +149,16 @@ class BaseCodeWindow(Widget):
         if too_large:
             raise FileSizeError("File too large")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _error_banner(*lines: str) -> str:
+        """
+        Render the ASCII art banner for an error message, once per message
+        """
+        from art import text2art
+
+        return "\n\n".join(text2art(line, font="univers") for line in lines)
+
     @classmethod
     def handle_exception(cls, exception: Exception) -> str:
         """
@@ -120,29 +182,16 @@ class BaseCodeWindow(Widget):
         str
             The error message to display.
         """
-        font = "univers"
         if isinstance(exception, ArchiveFileError):
-            error_message = (
-                text2art("ARCHIVE", font=font) + "\n\n" + text2art("FILE", font=font)
-            )
+            error_message = cls._error_banner("ARCHIVE", "FILE")
         elif isinstance(exception, FileSizeError):
-            error_message = (
-                text2art("FILE TOO", font=font) + "\n\n" + text2art("LARGE", font=font)
-            )
+            error_message = cls._error_banner("FILE TOO", "LARGE")
         elif isinstance(exception, PermissionError):
-            error_message = (
-                text2art("PERMISSION", font=font)
-                + "\n\n"
-                + text2art("ERROR", font=font)
-            )
+            error_message = cls._error_banner("PERMISSION", "ERROR")
         elif isinstance(exception, UnicodeError):
-            error_message = (
-                text2art("ENCODING", font=font) + "\n\n" + text2art("ERROR", font=font)
-            )
+            error_message = cls._error_banner("ENCODING", "ERROR")
         elif isinstance(exception, FileNotFoundError):
-            error_message = (
-                text2art("FILE NOT", font=font) + "\n\n" + text2art("FOUND", font=font)
-            )
+            error_message = cls._error_banner("FILE NOT", "FOUND")
         else:
             raise exception from exception
         return error_message
@@ -157,6 +206,7 @@ class StaticWindow(Static, BaseCodeWindow):
     theme: Reactive[str] = reactive(favorite_themes[0])
 
     rich_themes: ClassVar[list[str]] = favorite_themes
+    lexer_guess_chars: ClassVar[int] = 4096
 
     def __init__(
         self, config_object: TextualAppContext, *args: Any, **kwargs: Any
@@ -180,7 +230,11 @@ class StaticWindow(Static, BaseCodeWindow):
         """
         Convert text to syntax
         """
-        lexer = Syntax.guess_lexer(str(file_path), code=text)
+        file_name = str(file_path)
+        extension = os.path.splitext(file_name)[1].lower()
+        lexer = file_extension_lexers.get(extension) or self._guess_lexer(
+            file_name, text[: self.lexer_guess_chars]
+        )
         return Syntax(
             code=text,
             lexer=lexer,
@@ -190,6 +244,14 @@ class StaticWindow(Static, BaseCodeWindow):
             theme=self.theme,
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _guess_lexer(file_name: str, code: str) -> str:
+        """
+        Guess the lexer for a file from the start of its content
+        """
+        return Syntax.guess_lexer(file_name, code=code)
+
     def watch_linenos(self, linenos: bool) -> None:
         """
         Called when linenos is modified.
@@ -231,20 +293,42 @@ class DataTableWindow(VimDataTable, BaseCodeWindow):
     A DataTable widget for displaying code.
     """
 
-    def refresh_from_file(self, file_path: UPath, max_lines: int | None = None) -> None:
+    def file_to_df(
+        self, file_path: UPath, max_lines: int | None = None
+    ) -> pd.DataFrame:
         """
-        Load a file into a DataTable
+        Load a file into a pandas.DataFrame
         """
+        import pandas as pd
+
+        suffix = file_path.suffix.lower()
         if ".csv" in file_path.suffixes:
-            df = pd.read_csv(file_path, nrows=max_lines)
-        elif file_path.suffix.lower() in [".parquet"]:
-            df = pd.read_parquet(file_path).head(max_lines)
-        elif file_path.suffix.lower() in [".feather", ".fea"]:
-            df = pd.read_feather(file_path).head(max_lines)
+            return pd.read_csv(file_path, nrows=max_lines)
+        elif suffix == ".parquet":
+            if max_lines is None:
+                return pd.read_parquet(file_path)
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                return pd.read_parquet(file_path).head(max_lines)
+            with file_path.open("rb") as buffer:
+                parquet_file = pq.ParquetFile(buffer)
+                batches = parquet_file.iter_batches(batch_size=max_lines)
+                first_batch = next(batches, None)
+                if first_batch is None:
+                    return parquet_file.schema_arrow.empty_table().to_pandas()
+                return first_batch.to_pandas()
+        elif suffix in (".feather", ".fea"):
+            return pd.read_feather(file_path).head(max_lines)
         else:
             msg = f"Cannot render file as a DataTable, {file_path}."
             raise NotImplementedError(msg)
-        self.refresh_from_df(df)
+
+    def refresh_from_file(self, file_path: UPath, max_lines: int | None = None) -> None:
+        """
+        Load a file into a DataTable
+        """
+        self.refresh_from_df(self.file_to_df(file_path=file_path, max_lines=max_lines))
 
     def refresh_from_df(
         self,
@@ -274,13 +358,16 @@ class DataTableWindow(VimDataTable, BaseCodeWindow):
         if show_index:
             index_name = str(index_name) if index_name else ""
             self.add_column(index_name)
-        for column in pandas_dataframe.columns:
-            self.add_column(str(column))
-        pandas_dataframe.replace([np.NaN], [""], inplace=True)
-        for index, value_list in enumerate(pandas_dataframe.values.tolist()):
-            row = [str(index)] if show_index else []
-            row += [str(x) for x in value_list]
-            self.add_row(*row)
+        self.add_columns(*(str(column) for column in pandas_dataframe.columns))
+        string_columns = [
+            column.astype(object).where(column.notna(), "").map(str).tolist()
+            for _, column in pandas_dataframe.items()
+        ]
+        rows: Iterable[tuple[str, ...]] = zip(*string_columns)
+        if show_index:
+            rows = ((str(index), *row) for index, row in enumerate(rows))
+        with self.app.batch_update():
+            self.add_rows(rows)
 
 
 class WindowSwitcher(Container):
@@ -290,16 +377,18 @@ class WindowSwitcher(Container):
 
     show_tree: Reactive[bool] = reactive(True)
 
-    datatable_extensions: ClassVar[list[str]] = [
-        ".csv",
-        ".parquet",
-        ".feather",
-        ".fea",
-        ".csv.gz",
-    ]
-    image_extensions: ClassVar[list[str]] = image_file_extensions.copy()
-    markdown_extensions: ClassVar[list[str]] = [".md"]
-    json_extensions: ClassVar[list[str]] = [".json"]
+    datatable_extensions: ClassVar[frozenset[str]] = frozenset(
+        {
+            ".csv",
+            ".parquet",
+            ".feather",
+            ".fea",
+            ".csv.gz",
+        }
+    )
+    image_extensions: ClassVar[frozenset[str]] = image_file_extensions
+    markdown_extensions: ClassVar[frozenset[str]] = frozenset({".md"})
+    json_extensions: ClassVar[frozenset[str]] = frozenset({".json"})
 
     def __init__(
         self, config_object: TextualAppContext, *args: Any, **kwargs: Any
@@ -344,41 +433,65 @@ class WindowSwitcher(Container):
             else:
                 screens[window_screen].display = False
 
-    def render_file(self, file_path: UPath, scroll_home: bool = True) -> None:
+    def render_file(
+        self, file_path: UPath, file_info: FileInfo, scroll_home: bool = True
+    ) -> None:
         """
         Render a file
         """
-        switch_window = self.static_window
+        content = self.load_file(file_path=file_path, file_info=file_info)
+        self.show_file(file_path=file_path, content=content, scroll_home=scroll_home)
+
+    def load_file(
+        self, file_path: UPath, file_info: FileInfo
+    ) -> Syntax | Markdown | Pixels | pd.DataFrame:
+        """
+        Load a file into its displayable content
+
+        This doesn't touch any widgets, so it's safe to call from a worker thread.
+        The caller's `file_info` is reused instead of statting the file again.
+        """
         joined_suffixes = "".join(file_path.suffixes).lower()
+        suffix = file_path.suffix.lower()
+        max_lines = self.config_object.max_lines
         if joined_suffixes in self.datatable_extensions:
-            self.datatable_window.refresh_from_file(
-                file_path=file_path, max_lines=self.config_object.max_lines
+            return self.datatable_window.file_to_df(
+                file_path=file_path, max_lines=max_lines
             )
-            switch_window = self.datatable_window
-        elif file_path.suffix.lower() in self.image_extensions:
-            image = self.static_window.file_to_image(file_path=file_path)
-            self.static_window.update(image)
-        elif file_path.suffix.lower() in self.markdown_extensions:
-            markdown = self.static_window.file_to_markdown(
-                file_path=file_path, max_lines=self.config_object.max_lines
+        elif suffix in self.image_extensions:
+            return self.static_window.file_to_image(
+                file_path=file_path, file_info=file_info
             )
-            self.static_window.update(markdown)
-        elif file_path.suffix.lower() in self.json_extensions:
-            json_str = self.static_window.file_to_json(
-                file_path=file_path, max_lines=self.config_object.max_lines
+        elif suffix in self.markdown_extensions:
+            return self.static_window.file_to_markdown(
+                file_path=file_path, max_lines=max_lines
             )
-            json_syntax = self.static_window.text_to_syntax(
-                text=json_str, file_path=file_path
+        elif suffix in self.json_extensions:
+            json_str = self.static_window.file_to_json(
+                file_path=file_path, max_lines=max_lines
             )
-            self.static_window.update(json_syntax)
+            return self.static_window.text_to_syntax(text=json_str, file_path=file_path)
+        string = self.static_window.file_to_string(
+            file_path=file_path, max_lines=max_lines
+        )
+        return self.static_window.text_to_syntax(text=string, file_path=file_path)
+
+    def show_file(
+        self,
+        file_path: UPath,
+        content: Syntax | Markdown | Pixels | pd.DataFrame,
+        scroll_home: bool = True,
+    ) -> None:
+        """
+        Display content loaded by `load_file` in the matching window
+        """
+        switch_window: BaseCodeWindow
+        if is_renderable(content):
+            self.static_window.update(cast(RenderableType, content))
             switch_window = self.static_window
         else:
-            string = self.static_window.file_to_string(
-                file_path=file_path, max_lines=self.config_object.max_lines
-            )
-            syntax = self.static_window.text_to_syntax(text=string, file_path=file_path)
-            self.static_window.update(syntax)
-            switch_window = self.static_window
+            self.datatable_window.refresh_from_df(cast("pd.DataFrame", content))
+            switch_window = self.datatable_window
         self.switch_window(switch_window)
         active_widget = self.get_active_widget()
         if scroll_home:
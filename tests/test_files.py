@@ -0,0 +1,58 @@
+"""
+File Info Bar Tests
+"""
+
+from rich.text import Text
+from textual_universal_directorytree import UPath
+
+from browsr.utils import FileInfo
+from browsr.widgets.files import CurrentFileInfoBar
+
+
+def _remote_file_info_bar(url: str) -> CurrentFileInfoBar:
+    """
+    Build a CurrentFileInfoBar for a remote file
+    """
+    file_info_bar = CurrentFileInfoBar()
+    file_info_bar.file_info = FileInfo(
+        file=UPath(url),
+        size=1,
+        last_modified=None,
+        stat={},
+        is_local=False,
+        is_file=True,
+        owner="",
+        group="",
+        is_cloudpath=True,
+    )
+    return file_info_bar
+
+
+def test_directory_options_bucket_name() -> None:
+    """
+    Test that a bucket named after its protocol keeps its full name
+    """
+    file_info_bar = _remote_file_info_bar("s3://s3-bucket/file.txt")
+    directory_options = file_info_bar.render_directory_options()
+    assert directory_options == "  📂  s3-bucket  💾  file.txt"
+    assert file_info_bar.render_file_protocol() == "🗂️  S3"
+
+
+def test_directory_options_protocol_prefix() -> None:
+    """
+    Test that only the protocol prefix is stripped from a bucket root
+    """
+    file_info_bar = _remote_file_info_bar("gs://gs-bucket/file.txt")
+    directory_options = file_info_bar.render_directory_options()
+    assert directory_options == "  📂  gs-bucket  💾  file.txt"
+
+
+def test_render_text_style() -> None:
+    """
+    Test that the info bar renders with the shared text style
+    """
+    file_info_bar = _remote_file_info_bar("s3://s3-bucket/file.txt")
+    rendered = file_info_bar.render()
+    assert isinstance(rendered, Text)
+    assert rendered.style == CurrentFileInfoBar.text_style
+    assert rendered.plain == "🗂️  S3  🗄️️  1B  📂  s3-bucket  💾  file.txt"
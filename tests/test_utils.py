@@ -0,0 +1,48 @@
+"""
+Utility Function Tests
+"""
+
+import pathlib
+
+from textual_universal_directorytree import UPath
+
+from browsr.utils import handle_duplicate_filenames
+
+
+def test_handle_duplicate_filenames_new_file(tmp_path: pathlib.Path) -> None:
+    """
+    Test that a file that doesn't exist yet keeps its name
+    """
+    file_path = UPath(tmp_path) / "a.txt"
+    assert handle_duplicate_filenames(file_path=file_path) == file_path
+
+
+def test_handle_duplicate_filenames_existing(tmp_path: pathlib.Path) -> None:
+    """
+    Test that existing files are numbered after the last duplicate
+    """
+    file_path = UPath(tmp_path) / "a.txt"
+    file_path.touch()
+    assert handle_duplicate_filenames(file_path=file_path).name == "a (1).txt"
+    (UPath(tmp_path) / "a (1).txt").touch()
+    assert handle_duplicate_filenames(file_path=file_path).name == "a (2).txt"
+
+
+def test_handle_duplicate_filenames_gap(tmp_path: pathlib.Path) -> None:
+    """
+    Test that the first free number is used
+    """
+    for name in ["a.txt", "a (1).txt", "a (3).txt"]:
+        (UPath(tmp_path) / name).touch()
+    file_path = UPath(tmp_path) / "a.txt"
+    assert handle_duplicate_filenames(file_path=file_path).name == "a (2).txt"
+
+
+def test_handle_duplicate_filenames_leading_zeros(tmp_path: pathlib.Path) -> None:
+    """
+    Test that zero padded numbers aren't mistaken for generated duplicates
+    """
+    for name in ["a.txt", "a (01).txt"]:
+        (UPath(tmp_path) / name).touch()
+    file_path = UPath(tmp_path) / "a.txt"
+    assert handle_duplicate_filenames(file_path=file_path).name == "a (1).txt"